@@ -1,6 +1,8 @@
 # /// script
 # requires-python = "==3.12.*"
 # dependencies = [
+#   "httpx[http2]",
+#   "lxml",
 #   "pypandoc-binary",
 #   "playwright"
 # ]
@@ -8,27 +10,91 @@
 """html_to_markdown.py
 
 Converts HTML input (URL or local file) to Markdown using Pandoc via pypandoc.
+A file of URLs (`--urls_file`) can also be converted in one run, several at a time,
+into one Markdown file per URL.
 
-For URLs, this script uses Playwright to load the page in a real browser engine
-and extracts the rendered DOM (HTML after JavaScript execution).
+For URLs, this script first tries a plain HTTP GET; if the returned HTML already
+has real body content, it is used directly. Otherwise (e.g. an empty SPA shell),
+it uses Playwright to load the page in a real browser engine and extracts the
+rendered DOM (HTML after JavaScript execution).
 """
 
 import argparse
+import atexit
+import codecs
+import contextlib
+import functools
+import hashlib
+import importlib.metadata
 import logging
+import os
+import re
 import sys
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
 
-import pypandoc
+import httpx
+import lxml.html
+from lxml import etree
 
 LOGGER: logging.Logger = logging.getLogger(__name__)
 
+## Playwright defaults; any other value counts as an explicit browser option (see uses_browser_options())
+DEFAULT_BROWSER: str = 'chromium'
+DEFAULT_WAIT_UNTIL: str = 'load'
+
+## static-fetch heuristics: below this much visible body text, assume the page needs JavaScript to render
+MIN_STATIC_TEXT_CHARS: int = 200
+SPA_SHELL_MARKERS: tuple[str, ...] = (
+    '<div id="root"></div>',
+    '<div id="app"></div>',
+    '<div id="__next"></div>',
+    '<app-root></app-root>',
+)
+BODY_PATTERN: re.Pattern[str] = re.compile(r'<body[^>]*>(.*)</body>', re.IGNORECASE | re.DOTALL)
+NON_TEXT_ELEMENT_PATTERN: re.Pattern[str] = re.compile(
+    r'<(script|style|noscript|template)\b.*?</\1\s*>', re.IGNORECASE | re.DOTALL
+)
+TAG_PATTERN: re.Pattern[str] = re.compile(r'<[^>]+>')
+
+## static-fetch decoding: without a Content-Type charset, the page's own BOM or <meta> charset (near the top) is used
+CHARSET_SNIFF_BYTES: int = 2048
+BOM_ENCODINGS: tuple[tuple[bytes, str], ...] = (
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+META_CHARSET_PATTERN: re.Pattern[bytes] = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?\s*([A-Za-z0-9_.:-]+)', re.IGNORECASE)
+
+## `--urls_file` output filenames: URL runs of non-alphanumerics become underscores
+FILENAME_UNSAFE_PATTERN: re.Pattern[str] = re.compile(r'[^A-Za-z0-9]+')
+MAX_FILENAME_SLUG_CHARS: int = 100
+
+## resource types Playwright may skip with `--strip_assets`; Markdown output never uses them
+STRIPPABLE_RESOURCE_TYPES: frozenset[str] = frozenset({'font', 'image', 'media', 'stylesheet'})
+
+## elements stripped before Pandoc sees the HTML: scripts/styles/templates yield no Markdown text, and
+## inline <svg> (which Pandoc would turn into a data-URI image) and <iframe> embeds are dropped on purpose
+NON_CONTENT_TAGS: tuple[str, ...] = ('script', 'style', 'noscript', 'svg', 'iframe', 'template')
+
+## on-disk cache of converted Markdown; bump CACHE_KEY_VERSION whenever conversion output changes for the same input
+CACHE_DIR: Path = Path.home() / '.cache' / 'html_to_markdown'
+CACHE_KEY_VERSION: str = '2'
+
+## shared across static fetches so repeated requests reuse pooled (HTTP/2) connections; see get_http_client()
+_HTTP_CLIENT: httpx.Client | None = None
+_HTTP_CLIENT_LOCK: threading.Lock = threading.Lock()
+
 
 def parse_args(argv: list[str]) -> argparse.Namespace:
     """Parses command-line arguments."""
     parser: argparse.ArgumentParser = argparse.ArgumentParser(
         description=(
             'Convert HTML (URL or local file) to Markdown using Pandoc (via pypandoc). '
-            'For URLs, uses Playwright to capture the rendered DOM (post-JS).'
+            'For URLs, tries a plain HTTP GET first and falls back to Playwright to capture '
+            'the rendered DOM (post-JS) when the static HTML looks like a JavaScript shell.'
         ),
     )
 
@@ -36,14 +102,51 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
     input_group.add_argument(
         '--url',
         type=str,
-        help='Input URL to load in Playwright and extract rendered HTML from.',
+        help='Input URL to fetch (plain HTTP first, then Playwright if needed) and extract HTML from.',
     )
     input_group.add_argument(
         '--html_path',
         type=Path,
         help='Path to an input HTML file.',
     )
+    input_group.add_argument(
+        '--html_paths',
+        type=Path,
+        nargs='+',
+        help=(
+            'Paths to several input HTML files, converted in a single Pandoc run (one process startup) '
+            'and printed as one combined Markdown document.'
+        ),
+    )
+    input_group.add_argument(
+        '--urls_file',
+        type=Path,
+        help=(
+            'Path to a text file of URLs (one per line; blank lines and #-comments ignored). '
+            'Each URL is converted to its own Markdown file in --out_dir.'
+        ),
+    )
 
+    parser.add_argument(
+        '--out_dir',
+        type=Path,
+        default=None,
+        help='Output directory for --urls_file Markdown files (created if missing). Required with --urls_file.',
+    )
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=8,
+        help='Number of --urls_file URLs to fetch and convert at the same time. Default: 8.',
+    )
+    parser.add_argument(
+        '--always_render',
+        action='store_true',
+        help=(
+            'Skip the plain-HTTP fast path and always load URLs in Playwright. Implied by any explicit browser option '
+            '(--headed, --browser, --wait_until, --wait_for_selector, --extra_wait_ms, --strip_assets).'
+        ),
+    )
     parser.add_argument(
         '--timeout_seconds',
         type=float,
@@ -53,7 +156,7 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
     parser.add_argument(
         '--browser',
         type=str,
-        default='chromium',
+        default=DEFAULT_BROWSER,
         choices=['chromium', 'firefox', 'webkit'],
         help='Playwright browser engine to use. Default: chromium.',
     )
@@ -65,7 +168,7 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
     parser.add_argument(
         '--wait_until',
         type=str,
-        default='load',
+        default=DEFAULT_WAIT_UNTIL,
         choices=['load', 'domcontentloaded', 'networkidle'],
         help='Navigation wait condition. Default: load.',
     )
@@ -81,11 +184,16 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
         default=0,
         help='Optional extra fixed wait after navigation/selector, in milliseconds (e.g. 500). Default: 0.',
     )
+    parser.add_argument(
+        '--strip_assets',
+        action='store_true',
+        help='Block fonts, images, media, and stylesheets in Playwright for faster page loads (may affect rendering).',
+    )
     parser.add_argument(
         '--user_agent',
         type=str,
         default=None,
-        help='Optional user-agent string to use for Playwright browser context.',
+        help='Optional user-agent string to use for the HTTP fetch and the Playwright browser context.',
     )
 
     parser.add_argument(
@@ -94,6 +202,11 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
         default='gfm-raw_html',
         help='Pandoc output format. Default: gfm-raw_html (suppresses raw HTML in output).',
     )
+    parser.add_argument(
+        '--no_cache',
+        action='store_true',
+        help=f'Always run Pandoc instead of reusing a cached conversion of identical HTML from {CACHE_DIR}.',
+    )
     parser.add_argument(
         '--log_level',
         type=str,
@@ -102,6 +215,10 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
     )
 
     args: argparse.Namespace = parser.parse_args(argv)
+    if args.urls_file and not args.out_dir:
+        parser.error('--out_dir is required with --urls_file')
+    if args.concurrency < 1:
+        parser.error('--concurrency must be at least 1')
     return args
 
 
@@ -117,17 +234,166 @@ def configure_logging(log_level: str) -> None:
 
 
 def read_html_file(path: Path) -> str:
-    """Reads HTML content from a local file."""
+    """Reads HTML content from a local file (one disk read; undecodable bytes are replaced)."""
+    raw: bytes = path.read_bytes()
     html: str = ''
     try:
-        html = path.read_text(encoding='utf-8')
+        html = raw.decode('utf-8')
     except UnicodeDecodeError:
-        raw: bytes = path.read_bytes()
         html = raw.decode('utf-8', errors='replace')
 
     return html
 
 
+def read_html_files(paths: list[Path]) -> list[str]:
+    """Reads HTML content from local files, in order."""
+    for path in paths:
+        if not path.exists():
+            raise FileNotFoundError(f'Input HTML file does not exist: {path}')
+    documents: list[str] = [read_html_file(path) for path in paths]
+    return documents
+
+
+def read_urls_file(path: Path) -> list[str]:
+    """Reads URLs from a text file, one per line, skipping blank lines, #-comments, and repeats (order is kept)."""
+    urls: list[str] = []
+    for line in path.read_text(encoding='utf-8').splitlines():
+        url: str = line.strip()
+        if url and not url.startswith('#'):
+            urls.append(url)
+    unique_urls: list[str] = list(dict.fromkeys(urls))  # duplicates would race to write the same output file
+    return unique_urls
+
+
+def markdown_filename_for_url(url: str) -> str:
+    """Builds a filesystem-safe, collision-resistant Markdown filename for a URL."""
+    without_scheme: str = url.split('://', 1)[-1]
+    slug: str = FILENAME_UNSAFE_PATTERN.sub('_', without_scheme).strip('_')[:MAX_FILENAME_SLUG_CHARS] or 'index'
+    url_digest: str = hashlib.sha256(url.encode('utf-8')).hexdigest()[:8]
+    filename: str = f'{slug}_{url_digest}.md'
+    return filename
+
+
+def strip_non_content_elements(html: str) -> str:
+    """Removes non-content elements (see NON_CONTENT_TAGS) so Pandoc has less to parse.
+
+    Input lxml cannot parse (e.g. empty, or a unicode string with an XML encoding declaration) is returned unchanged.
+    """
+    stripped: str = html
+    try:
+        tree: lxml.html.HtmlElement = lxml.html.document_fromstring(html)
+        etree.strip_elements(tree, *NON_CONTENT_TAGS, with_tail=False)
+        stripped = lxml.html.tostring(tree, encoding='unicode')
+    except (etree.ParserError, ValueError) as exc:
+        LOGGER.debug('Skipping non-content stripping (%s).', exc)
+    return stripped
+
+
+def prepare_html_for_pandoc(documents: list[str]) -> str:
+    """Strips non-content elements from each document and joins them into one Pandoc input.
+
+    Documents are joined with blank lines, which is what Pandoc itself does with multiple input files.
+    Stripping happens per document because lxml keeps only the first of several concatenated documents.
+    """
+    html: str = '\n\n'.join(strip_non_content_elements(document) for document in documents)
+    return html
+
+
+def looks_like_js_shell(html: str) -> bool:
+    """Checks whether static HTML looks like it needs JavaScript to render its content."""
+    lowered: str = html.lower()
+    body_match: re.Match[str] | None = BODY_PATTERN.search(lowered)
+    body: str = body_match.group(1) if body_match else lowered
+    body = NON_TEXT_ELEMENT_PATTERN.sub(' ', body)
+    visible_text: str = ''.join(TAG_PATTERN.sub(' ', body).split())
+
+    is_shell: bool = len(visible_text) < MIN_STATIC_TEXT_CHARS or any(marker in lowered for marker in SPA_SHELL_MARKERS)
+    return is_shell
+
+
+def sniff_html_charset(raw: bytes) -> str | None:
+    """Finds the charset a document declares itself: a byte-order mark, else a <meta> charset near the top."""
+    charset: str | None = None
+    for bom, bom_encoding in BOM_ENCODINGS:
+        if charset is None and raw.startswith(bom):
+            charset = bom_encoding
+    if charset is None:
+        meta_match: re.Match[bytes] | None = META_CHARSET_PATTERN.search(raw[:CHARSET_SNIFF_BYTES])
+        if meta_match:
+            charset = meta_match.group(1).decode('ascii')
+    return charset
+
+
+def decode_html_bytes(raw: bytes, charset: str | None) -> str:
+    """Decodes raw HTML bytes once.
+
+    Uses the Content-Type charset when given, else the document's own BOM/<meta> charset, else UTF-8;
+    an unknown charset name falls through to the next choice.
+    """
+    html: str = ''
+    decoded: bool = False
+    for encoding in (charset, sniff_html_charset(raw), 'utf-8'):
+        if encoding and not decoded:
+            try:
+                html = raw.decode(encoding, errors='replace')
+                decoded = True
+            except LookupError:
+                LOGGER.debug('Unknown charset %r; trying the next candidate.', encoding)
+    return html
+
+
+def get_http_client() -> httpx.Client:
+    """Returns the shared httpx client, creating it (and registering its cleanup) on first use."""
+    global _HTTP_CLIENT
+    with _HTTP_CLIENT_LOCK:  # `--urls_file` worker threads may race to create it
+        if _HTTP_CLIENT is None:
+            _HTTP_CLIENT = httpx.Client(
+                http2=True,
+                follow_redirects=True,
+                limits=httpx.Limits(max_keepalive_connections=20),
+            )
+            atexit.register(_HTTP_CLIENT.close)
+    return _HTTP_CLIENT
+
+
+def fetch_html_static(url: str, timeout_seconds: float, user_agent: str | None) -> tuple[str, str] | None:
+    """Fetches HTML from a URL with a plain HTTP GET, without a browser.
+
+    The response is streamed so the body is only downloaded for successful HTML responses.
+
+    Returns:
+        (html, final_url), or None when the fetch fails or the page looks like a JavaScript shell.
+    """
+    headers: dict[str, str] = {'User-Agent': user_agent} if user_agent else {}
+    result: tuple[str, str] | None = None
+
+    try:
+        client: httpx.Client = get_http_client()
+        with client.stream('GET', url, headers=headers, timeout=timeout_seconds) as response:
+            response.raise_for_status()
+            content_type: str = response.headers.get('content-type', '')
+            if 'html' not in content_type.lower():
+                LOGGER.debug('Static fetch returned non-HTML content-type %r; falling back.', content_type)
+            else:
+                html: str = decode_html_bytes(response.read(), response.charset_encoding)
+                if looks_like_js_shell(html):
+                    LOGGER.debug('Static HTML looks like a JavaScript shell; falling back.')
+                else:
+                    result = (html, str(response.url))
+    except httpx.HTTPError as exc:
+        LOGGER.debug('Static fetch failed (%s); falling back.', exc)
+
+    return result
+
+
+def abort_strippable_route(route) -> None:
+    """Aborts Playwright requests (`route` is a `playwright.sync_api.Route`) for asset types the Markdown output discards."""
+    if route.request.resource_type in STRIPPABLE_RESOURCE_TYPES:
+        route.abort()
+    else:
+        route.continue_()
+
+
 def fetch_html_rendered_playwright(
     url: str,
     timeout_seconds: float,
@@ -137,6 +403,7 @@ def fetch_html_rendered_playwright(
     wait_for_selector: str | None,
     extra_wait_ms: int,
     user_agent: str | None,
+    strip_assets: bool = False,
 ) -> tuple[str, str]:
     """Fetches rendered HTML from a URL by loading it in Playwright and extracting the DOM.
 
@@ -169,6 +436,8 @@ def fetch_html_rendered_playwright(
                 context = browser.new_context(user_agent=user_agent)
             else:
                 context = browser.new_context()
+            if strip_assets:
+                context.route('**/*', abort_strippable_route)
 
             page = context.new_page()
             page.goto(url, wait_until=wait_until, timeout=timeout_ms)
@@ -198,8 +467,62 @@ def fetch_html_rendered_playwright(
     return html, final_url
 
 
+def uses_browser_options(args: argparse.Namespace) -> bool:
+    """Checks whether the user asked for Playwright, via `--always_render` or any explicitly set browser option."""
+    wants_browser: bool = (
+        bool(args.always_render)
+        or bool(args.headed)
+        or str(args.browser) != DEFAULT_BROWSER
+        or str(args.wait_until) != DEFAULT_WAIT_UNTIL
+        or bool(args.wait_for_selector)
+        or int(args.extra_wait_ms) > 0
+        or bool(args.strip_assets)
+    )
+    return wants_browser
+
+
+def fetch_html_for_url(url: str, args: argparse.Namespace) -> tuple[str, str]:
+    """Fetches HTML for a URL, trying a plain HTTP GET before falling back to Playwright.
+
+    The fast path is skipped when the user asks for Playwright: `--always_render`, or any explicitly set
+    browser option (`--headed`, a non-default `--browser` or `--wait_until`, `--wait_for_selector`,
+    `--extra_wait_ms`, `--strip_assets`); see uses_browser_options().
+
+    Returns:
+        (html, final_url)
+    """
+    wants_browser: bool = uses_browser_options(args)
+    user_agent: str | None = str(args.user_agent) if args.user_agent else None
+
+    static_result: tuple[str, str] | None = None
+    if not wants_browser:
+        static_result = fetch_html_static(url=url, timeout_seconds=float(args.timeout_seconds), user_agent=user_agent)
+
+    if static_result:
+        html, final_url = static_result
+        LOGGER.info('Static fetch final URL: %s', final_url)
+    else:
+        html, final_url = fetch_html_rendered_playwright(
+            url=url,
+            timeout_seconds=float(args.timeout_seconds),
+            browser_name=str(args.browser),
+            headed=bool(args.headed),
+            wait_until=str(args.wait_until),
+            wait_for_selector=(str(args.wait_for_selector) if args.wait_for_selector else None),
+            extra_wait_ms=int(args.extra_wait_ms),
+            user_agent=user_agent,
+            strip_assets=bool(args.strip_assets),
+        )
+        LOGGER.info('Playwright final URL: %s', final_url)
+
+    return html, final_url
+
+
 def convert_html_to_markdown(html: str, output_format: str) -> str:
     """Converts HTML to Markdown using Pandoc via pypandoc."""
+    ## imported here (like Playwright) so the module's helpers import, and test, without pypandoc installed
+    import pypandoc
+
     input_format: str = 'html-native_divs-native_spans'
 
     normalized_output_format: str = output_format
@@ -219,32 +542,139 @@ def convert_html_to_markdown(html: str, output_format: str) -> str:
     return markdown
 
 
+@functools.cache
+def installed_pandoc_version() -> str:
+    """Returns the installed `pypandoc-binary` version (it determines the bundled Pandoc), without starting a process."""
+    try:
+        version: str = importlib.metadata.version('pypandoc-binary')
+    except importlib.metadata.PackageNotFoundError:
+        version = 'unknown'
+    return version
+
+
+def markdown_cache_path(documents: list[str], output_format: str, cache_dir: Path) -> Path:
+    """Builds the cache-file path for converting these raw HTML documents to this output format (SHA-256 keyed).
+
+    The key uses the documents as fetched/read (before any stripping), so a cache hit costs only this hash
+    and a file read. It includes the Pandoc version, so upgrading Pandoc doesn't keep serving older conversions.
+    """
+    key_prefix: str = f'{CACHE_KEY_VERSION}\0{installed_pandoc_version()}\0{output_format}\0'
+    digest = hashlib.sha256(key_prefix.encode('utf-8'))
+    for document in documents:
+        encoded_document: bytes = document.encode('utf-8', errors='surrogatepass')
+        digest.update(f'{len(encoded_document)}\0'.encode('ascii'))  # length prefix keeps document boundaries unambiguous
+        digest.update(encoded_document)
+    cache_path: Path = cache_dir / f'{digest.hexdigest()}.md'
+    return cache_path
+
+
+def convert_documents_to_markdown_cached(documents: list[str], output_format: str, cache_dir: Path = CACHE_DIR) -> str:
+    """Converts HTML documents to Markdown, reusing the on-disk result of a previous identical conversion.
+
+    Documents are only prepared for Pandoc (stripped and joined) on a cache miss.
+    Cache read/write problems are logged and otherwise ignored; they never fail the conversion.
+    """
+    cache_path: Path = markdown_cache_path(documents=documents, output_format=output_format, cache_dir=cache_dir)
+    markdown: str | None = None
+    try:
+        if cache_path.is_file():
+            markdown = cache_path.read_text(encoding='utf-8')
+            LOGGER.info('Using cached Markdown: %s', cache_path)
+    except OSError as exc:
+        LOGGER.warning('Could not read Markdown cache %s: %s', cache_path, exc)
+
+    if markdown is None:
+        markdown = convert_html_to_markdown(html=prepare_html_for_pandoc(documents), output_format=output_format)
+        tmp_path: Path | None = None
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            ## write-then-rename, so a concurrent reader never sees a partial file
+            with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=cache_dir, suffix='.tmp', delete=False) as tmp_file:
+                tmp_path = Path(tmp_file.name)
+                tmp_file.write(markdown)
+            os.replace(tmp_path, cache_path)
+        except OSError as exc:
+            LOGGER.warning('Could not write Markdown cache %s: %s', cache_path, exc)
+            if tmp_path is not None:
+                ## don't leave stray *.tmp files in the cache dir (best-effort, like the rest of the caching)
+                with contextlib.suppress(OSError):
+                    tmp_path.unlink(missing_ok=True)
+
+    return markdown
+
+
+def convert_documents_to_markdown(documents: list[str], output_format: str, use_cache: bool) -> str:
+    """Prepares HTML documents for Pandoc and converts them to one Markdown string (optionally via the disk cache)."""
+    if use_cache:
+        markdown: str = convert_documents_to_markdown_cached(documents=documents, output_format=output_format)
+    else:
+        markdown = convert_html_to_markdown(html=prepare_html_for_pandoc(documents), output_format=output_format)
+    return markdown
+
+
+def convert_url_to_markdown_file(url: str, args: argparse.Namespace, out_dir: Path) -> Path:
+    """Fetches one URL, converts it, and writes the Markdown into out_dir.
+
+    Returns:
+        The path of the written Markdown file.
+    """
+    html, _final_url = fetch_html_for_url(url=url, args=args)
+    markdown: str = convert_documents_to_markdown(
+        documents=[html], output_format=str(args.output_format), use_cache=not args.no_cache
+    )
+    out_path: Path = out_dir / markdown_filename_for_url(url)
+    out_path.write_text(markdown, encoding='utf-8')
+    return out_path
+
+
+def run_urls_file(args: argparse.Namespace) -> int:
+    """Converts every URL in --urls_file to its own Markdown file in --out_dir, --concurrency at a time.
+
+    Worker threads share the pooled httpx client; a failed URL is logged and does not stop the others.
+    """
+    urls: list[str] = read_urls_file(Path(args.urls_file))
+    out_dir: Path = Path(args.out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    failure_count: int = 0
+    with ThreadPoolExecutor(max_workers=int(args.concurrency)) as executor:
+        futures: dict[Future[Path], str] = {
+            executor.submit(convert_url_to_markdown_file, url, args, out_dir): url for url in urls
+        }
+        for future in as_completed(futures):
+            url: str = futures[future]
+            try:
+                out_path: Path = future.result()
+                LOGGER.info('Converted %s -> %s', url, out_path)
+            except Exception as exc:  # noqa: BLE001
+                LOGGER.error('Failed to convert %s: %s', url, exc)
+                failure_count += 1
+
+    LOGGER.info('Converted %d of %d URLs into %s', len(urls) - failure_count, len(urls), out_dir)
+    exit_code: int = 1 if failure_count else 0
+    return exit_code
+
+
 def run(args: argparse.Namespace) -> int:
     """Runs the conversion workflow."""
     exit_code: int = 0
 
     try:
-        html: str = ''
-        if args.url:
-            html, final_url = fetch_html_rendered_playwright(
-                url=str(args.url),
-                timeout_seconds=float(args.timeout_seconds),
-                browser_name=str(args.browser),
-                headed=bool(args.headed),
-                wait_until=str(args.wait_until),
-                wait_for_selector=(str(args.wait_for_selector) if args.wait_for_selector else None),
-                extra_wait_ms=int(args.extra_wait_ms),
-                user_agent=(str(args.user_agent) if args.user_agent else None),
-            )
-            LOGGER.info('Playwright final URL: %s', final_url)
+        if args.urls_file:
+            exit_code = run_urls_file(args)
         else:
-            in_path: Path = Path(args.html_path)
-            if not in_path.exists():
-                raise FileNotFoundError(f'Input HTML file does not exist: {in_path}')
-            html = read_html_file(in_path)
+            documents: list[str] = []
+            if args.url:
+                html, _final_url = fetch_html_for_url(url=str(args.url), args=args)
+                documents = [html]
+            else:
+                in_paths: list[Path] = [Path(args.html_path)] if args.html_path else list(args.html_paths)
+                documents = read_html_files(in_paths)
 
-        markdown: str = convert_html_to_markdown(html=html, output_format=str(args.output_format))
-        print(markdown)
+            markdown: str = convert_documents_to_markdown(
+                documents=documents, output_format=str(args.output_format), use_cache=not args.no_cache
+            )
+            print(markdown)
     except OSError as exc:
         LOGGER.error('OS error (often means Pandoc is not installed/available): %s', exc)
         exit_code = 1
@@ -19,8 +19,11 @@ import httpx
 def list_top_level_py_files_from_repo(owner: str, repo: str, token_env: str = 'GITHUB_TOKEN') -> list[str]:
     """
     Return a sorted list of top-level .py filenames from the GitHub repo root, excluding index.py.
+
+    Uses the (non-recursive) git-trees endpoint, which returns only path/type/sha per entry,
+    rather than the much larger per-file records of the contents endpoint.
     """
-    url: str = f'https://api.github.com/repos/{owner}/{repo}/contents'
+    url: str = f'https://api.github.com/repos/{owner}/{repo}/git/trees/HEAD'
     headers: dict[str, str] = {'Accept': 'application/vnd.github+json', 'User-Agent': 'birkin-utilities-project'}
     token: str | None = os.getenv(token_env)
     if token:
@@ -32,13 +35,13 @@ def list_top_level_py_files_from_repo(owner: str, repo: str, token_env: str = 'G
         if resp.status_code != 200:
             # Keep a single return; bubble up error context via exception
             raise RuntimeError(f'GitHub API error {resp.status_code}: {resp.text}')
-        items: list[dict] = resp.json()
+        items: list[dict] = resp.json().get('tree', [])
         exclude: set[str] = {'index.py'}
         for item in items:
-            # item keys include: name, path, sha, size, url, html_url, git_url, download_url, type
-            if item.get('type') == 'file':
-                name: str = item.get('name', '')
-                if name.endswith('.py') and name not in exclude:
+            # item keys include: path, mode, type, sha, size (blobs only), url
+            if item.get('type') == 'blob':
+                name: str = item.get('path', '')
+                if name.endswith('.py') and '/' not in name and name not in exclude:
                     names.append(name)
     names.sort()
     return names
@@ -15,30 +15,42 @@ $ uv run ./prefix_with_date_time.py --source "foo bar" --add_timestamp "true"
 2025-09-06T21:46:45_foo_bar
 """
 
-import argparse
-from datetime import datetime
+import time
 
 
-def main(original: str, add_timestamp: str = 'false') -> None:
+def parse_true_false(value: str) -> bool:
+    """
+    Converts a command-line "true"/"false" string to a bool (case-insensitive; anything but "true" is False).
+    """
+    is_true: bool = value.strip().lower() == 'true'
+    return is_true
+
+
+def main(original: str, add_timestamp: bool = False) -> None:
     ## transform, print
-    date_part: str = datetime.now().strftime('%Y-%m-%d')
-    if isinstance(add_timestamp, str) and add_timestamp.lower() == 'true':
-        time_part: str = datetime.now().strftime('%H:%M:%S')
-        prefix: str = f'{date_part}T{time_part}'
+    now: time.struct_time = time.localtime()  # single clock read, so date and time parts always agree
+    if add_timestamp:
+        prefix: str = time.strftime('%Y-%m-%dT%H:%M:%S', now)
     else:
-        prefix: str = date_part
+        prefix: str = time.strftime('%Y-%m-%d', now)
     result: str = f'{prefix}_{original}'
     print(result)
 
 
 if __name__ == '__main__':
-    ## parse args
+    ## parse args (argparse is only needed here, so importing the module as a library skips it)
+    import argparse
+
     parser: argparse.ArgumentParser = argparse.ArgumentParser(description='prefix text with date or date-time')
     parser.add_argument('--source', required=True, help='source string to process')
     parser.add_argument(
-        '--add_timestamp', required=False, default='false', help='if "true", append ISO time (HH:MM:SS) to the date'
+        '--add_timestamp',
+        required=False,
+        type=parse_true_false,
+        default=False,
+        help='if "true", append ISO time (HH:MM:SS) to the date',
     )
     args: argparse.Namespace = parser.parse_args()
     original: str = args.source
-    add_timestamp: str = args.add_timestamp
+    add_timestamp: bool = args.add_timestamp
     main(original, add_timestamp)
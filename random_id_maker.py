@@ -8,6 +8,7 @@ Generates a random ID without confusing characters (e.g., 'O' and '0')
 Usage:
     uv run ./random_id_maker.py  # default length is 10
     uv run ./random_id_maker.py --length 20
+    uv run ./random_id_maker.py --count 1000  # one ID per line
 
 Uniqueness:
 The results below answer the question of how many IDs of a given length one can generate,
@@ -46,17 +47,55 @@ import argparse
 import secrets
 
 ALPHABET = 'abcdefghjkmnpqrstuvwxyz23456789ABCDEFGHJKMNPQRSTUVWXYZ'
+ALPHABET_BYTES: bytes = ALPHABET.encode('ascii')
+## random bytes are masked to 0-63 (the smallest power-of-two range covering the alphabet);
+## values past the end of the alphabet are rejected rather than wrapped, which avoids modulo bias
+BYTE_MASK: int = 63
+## lookup tables for `bytes.translate()`, which does the mask-and-reject per byte in C:
+## rejected bytes (masked value past the alphabet) are deleted first, so their table entries are never used
+REJECTED_BYTES: bytes = bytes(byte for byte in range(256) if byte & BYTE_MASK >= len(ALPHABET_BYTES))
+BYTE_TO_ALPHABET_TABLE: bytes = bytes(ALPHABET_BYTES[(byte & BYTE_MASK) % len(ALPHABET_BYTES)] for byte in range(256))
+
+
+def generate_ids(count: int, length: int = 10) -> list[str]:
+    """
+    Generates `count` random IDs from one shared bulk `secrets.token_bytes()` draw (rarely more), via rejection sampling.
+
+    Returns the IDs without printing them; batching avoids per-ID draw and call overhead for large runs.
+    """
+    total_length: int = count * length
+    id_bytes: bytearray = bytearray()
+    while len(id_bytes) < total_length:
+        ## about 84% of draws are accepted (54/64), so twice the shortfall almost always suffices
+        random_bytes: bytes = secrets.token_bytes(2 * (total_length - len(id_bytes)))
+        id_bytes += random_bytes.translate(BYTE_TO_ALPHABET_TABLE, REJECTED_BYTES)
+    ids: list[str] = [id_bytes[i * length : (i + 1) * length].decode('ascii') for i in range(count)]
+    return ids
 
 
 def generate_id_secure(length: int = 10) -> str:
-    id_secure: str = ''.join(secrets.choice(ALPHABET) for _ in range(length))
-    print(id_secure)
+    """
+    Generates a single random ID (see `generate_ids()`).
+
+    Returns the ID without printing it.
+    """
+    id_secure: str = generate_ids(1, length)[0]
     return id_secure
 
 
-if __name__ == '__main__':
-    parser = argparse.ArgumentParser(description='Generate a random ID')
+def main() -> None:
+    """
+    Parses args, then prints the generated ID(s), one per line.
+    """
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description='Generate a random ID')
     parser.add_argument('-l', '--length', type=int, default=10, help='Length of the generated ID (default: 10)')
-    args = parser.parse_args()
+    parser.add_argument('-c', '--count', type=int, default=1, help='Number of IDs to generate (default: 1)')
+    args: argparse.Namespace = parser.parse_args()
+    if args.count < 1:
+        parser.error('--count must be at least 1')
+    ids: list[str] = generate_ids(args.count, args.length)
+    print('\n'.join(ids))
+
 
-    generate_id_secure(args.length)
+if __name__ == '__main__':
+    main()
@@ -12,8 +12,6 @@ $ uv run https://gist.github.com/birkin/3debb7fdc9b63a3fc8eb3e4ee37091e9 --sourc
 foo_bar
 """
 
-import argparse
-
 
 def main(original: str) -> None:
     ## transform, print
@@ -22,7 +20,9 @@ def main(original: str) -> None:
 
 
 if __name__ == '__main__':
-    ## parse args
+    ## parse args (argparse is only needed here, so importing the module as a library skips it)
+    import argparse
+
     parser: argparse.ArgumentParser = argparse.ArgumentParser(description='replace spaces with underscores')
     parser.add_argument('--source', required=True, help='source string to process')
     args: argparse.Namespace = parser.parse_args()
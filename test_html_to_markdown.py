@@ -0,0 +1,96 @@
+"""
+Tests for the pure helpers in html_to_markdown.py (no network, no Pandoc, no browser).
+
+Usage:
+    $ uv run -m unittest test_html_to_markdown -v
+"""
+
+import unittest
+
+import html_to_markdown
+
+RENDERED_PAGE: str = (
+    '<html><head><title>t</title><script>var config = {};</script></head>'
+    f'<body><main><h1>Hours</h1><p>{"The library is open every day of the week. " * 10}</p></main></body></html>'
+)
+
+
+class TestLooksLikeJsShell(unittest.TestCase):
+    def test_rendered_page_is_not_a_shell(self) -> None:
+        """
+        Checks that a page with plenty of visible body text is used as-is.
+        """
+        self.assertFalse(html_to_markdown.looks_like_js_shell(RENDERED_PAGE))
+
+    def test_script_only_body_is_a_shell(self) -> None:
+        """
+        Checks that body text hidden inside scripts doesn't count as visible content.
+        """
+        html: str = f'<html><body><div id="main"></div><script>{"x" * 5000}</script></body></html>'
+        self.assertTrue(html_to_markdown.looks_like_js_shell(html))
+
+    def test_spa_marker_is_a_shell(self) -> None:
+        """
+        Checks that an empty SPA mount point marks the page as a shell, even alongside other text.
+        """
+        html: str = RENDERED_PAGE.replace('<main>', '<div id="root"></div><main>')
+        self.assertTrue(html_to_markdown.looks_like_js_shell(html))
+
+
+class TestDecodeHtmlBytes(unittest.TestCase):
+    def test_header_charset_is_used(self) -> None:
+        """
+        Checks that the Content-Type charset is used when given.
+        """
+        raw: bytes = '<p>Café</p>'.encode('cp1252')
+        self.assertEqual(html_to_markdown.decode_html_bytes(raw, 'windows-1252'), '<p>Café</p>')
+
+    def test_no_charset_uses_meta_charset(self) -> None:
+        """
+        Checks that, without a header charset, the page's own <meta> charset is honored.
+        """
+        html: str = '<html><head><meta charset="windows-1252"></head><body>Café résumé naïve</body></html>'
+        self.assertEqual(html_to_markdown.decode_html_bytes(html.encode('cp1252'), None), html)
+
+    def test_no_charset_defaults_to_utf8(self) -> None:
+        """
+        Checks that, with no charset anywhere, UTF-8 is used and undecodable bytes are replaced.
+        """
+        self.assertEqual(html_to_markdown.decode_html_bytes('<p>Café</p>'.encode(), None), '<p>Café</p>')
+        self.assertEqual(html_to_markdown.decode_html_bytes(b'caf\xe9', None), 'caf�')
+
+    def test_unknown_charset_falls_back(self) -> None:
+        """
+        Checks that an unknown charset name falls through to UTF-8 instead of raising.
+        """
+        raw: bytes = '<p>Café</p>'.encode()
+        self.assertEqual(html_to_markdown.decode_html_bytes(raw, 'no-such-charset'), '<p>Café</p>')
+
+
+class TestMarkdownFilenameForUrl(unittest.TestCase):
+    def test_filename_is_safe_slug_with_digest(self) -> None:
+        """
+        Checks that a URL becomes a filesystem-safe slug plus a short digest and a .md suffix.
+        """
+        filename: str = html_to_markdown.markdown_filename_for_url('https://lib.brown.edu/a/b?x=1')
+        self.assertRegex(filename, r'^lib_brown_edu_a_b_x_1_[0-9a-f]{8}\.md$')
+
+    def test_similar_urls_do_not_collide(self) -> None:
+        """
+        Checks that URLs differing only in punctuation (same slug) still get distinct filenames.
+        """
+        first: str = html_to_markdown.markdown_filename_for_url('https://example.org/a-b')
+        second: str = html_to_markdown.markdown_filename_for_url('https://example.org/a_b')
+        self.assertNotEqual(first, second)
+
+    def test_long_and_empty_urls(self) -> None:
+        """
+        Checks that long URLs are truncated and URLs with no usable characters fall back to 'index'.
+        """
+        long_filename: str = html_to_markdown.markdown_filename_for_url('https://example.org/' + 'a' * 500)
+        self.assertLessEqual(len(long_filename), html_to_markdown.MAX_FILENAME_SLUG_CHARS + len('_12345678.md'))
+        self.assertRegex(html_to_markdown.markdown_filename_for_url('https://'), r'^index_[0-9a-f]{8}\.md$')
+
+
+if __name__ == '__main__':
+    unittest.main()
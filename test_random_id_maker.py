@@ -0,0 +1,37 @@
+"""
+Tests for random_id_maker.py.
+
+Usage:
+    $ uv run -m unittest test_random_id_maker -v
+"""
+
+import unittest
+
+import random_id_maker
+
+
+class TestGenerateIds(unittest.TestCase):
+    def test_count_and_length(self) -> None:
+        """
+        Checks that the requested number of IDs is returned, each of the requested length.
+        """
+        ids: list[str] = random_id_maker.generate_ids(50, 12)
+        self.assertEqual(len(ids), 50)
+        self.assertTrue(all(len(id_) == 12 for id_ in ids))
+
+    def test_characters_come_from_alphabet(self) -> None:
+        """
+        Checks that every generated character is in ALPHABET (so no confusing characters like 'O' or '0').
+        """
+        ids: list[str] = random_id_maker.generate_ids(200, 10)
+        self.assertTrue(set(''.join(ids)) <= set(random_id_maker.ALPHABET))
+
+    def test_zero_count_returns_empty_list(self) -> None:
+        """
+        Checks that asking for zero IDs returns an empty list.
+        """
+        self.assertEqual(random_id_maker.generate_ids(0), [])
+
+
+if __name__ == '__main__':
+    unittest.main()